@@ -7,7 +7,7 @@ from nltk.stem.porter import PorterStemmer
 import warnings
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi import FastAPI
 from pydantic import BaseModel
 from app.utils.translator import translate_text
@@ -22,7 +22,7 @@ from app.chat_models import ChatRequest, ChatResponse
 from app.services.ocr_service import OCRService
 from app.services.translation_service import TranslationService
 from app.services.tts_service import TTSService
-from app.services.rag_service import RAGService
+from app.services.rag_service import RAGService, aclose_http_client
 
 load_dotenv()
 warnings.filterwarnings("ignore")
@@ -48,6 +48,11 @@ translation_service = TranslationService()
 tts_service = TTSService()
 rag_service = RAGService()
 
+@app.on_event("shutdown")
+async def shutdown():
+    rag_service.close()
+    await aclose_http_client()
+
 @app.get("/")
 def root():
     return {"message": "AI Services API is running"}
@@ -58,7 +63,7 @@ async def chat(request: ChatRequest):
     """Enhanced chat endpoint with smart features"""
     try:
         print(f"Received chat request: {request.message} in {request.language}")
-        response = rag_service.search_schemes(request.message, request.language)
+        response = await rag_service.search_schemes_async(request.message, request.language)
         return ChatResponse(
             response=response, 
             audio_url=None,
@@ -69,6 +74,26 @@ async def chat(request: ChatRequest):
         print(f"Chat error: {e}")
         return ChatResponse(response="Service temporarily unavailable", audio_url=None)
 
+@app.post("/chat/stream")
+def chat_stream(request: ChatRequest):
+    """Chat endpoint that streams the answer as it is generated"""
+    print(f"Received streaming chat request: {request.message} in {request.language}")
+    return StreamingResponse(
+        _stream_with_fallback(rag_service.search_schemes_stream(request.message, request.language)),
+        media_type="text/plain"
+    )
+
+def _stream_with_fallback(chunks):
+    """Headers are already sent once streaming starts, so report failures in the body"""
+    started = False
+    try:
+        for chunk in chunks:
+            started = True
+            yield chunk
+    except Exception as e:
+        print(f"Chat stream error: {e}")
+        yield ("\n\n" if started else "") + "Service temporarily unavailable"
+
 @app.post("/analyze-form")
 async def analyze_form(request: dict):
     """Analyze uploaded form image with OCR and AI assistance"""
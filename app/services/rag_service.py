@@ -1,74 +1,379 @@
 import os
+import asyncio
+import datetime
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Final
 from dotenv import load_dotenv
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import httpx
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from app.services.semantic_cache import SemanticCache
+from app.services.scheme_index import LocalSchemeIndex
+from app.services.prompt_templates import LOCALIZED_PROMPTS
 
-class RAGService:
-    def __init__(self):
-        load_dotenv()
+try:
+    # SIMD-accelerated drop-in for the stdlib base64 module
+    import pybase64 as base64
+except ImportError:
+    import base64
 
-        # ---- Gemini Setup ----
-        gemini_key = os.getenv("GOOGLE_API_KEY")
-        if not gemini_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables")
-        genai.configure(api_key=gemini_key)
-        self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
-        self.gemini_vision_model = genai.GenerativeModel('gemini-1.5-flash')
-        
-        # Backend URL for scheme search
-        self.backend_url = os.getenv("BACKEND_URL", "http://localhost:5000")
+# Context caching needs an explicitly versioned model name
+CACHE_MODEL_NAME = "models/gemini-1.5-flash-001"
+CACHE_TTL = datetime.timedelta(hours=1)
+# Gemini rejects cached content below this many tokens
+CACHE_MIN_TOKENS = 32768
+# Image formats sent to Gemini vision without re-encoding
+GEMINI_IMAGE_MIME_TYPES = {'image/png', 'image/jpeg', 'image/webp'}
+IMAGE_MAGIC_BYTES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+)
+# Distinct cached prefixes kept alive at once; least recently used are deleted
+PREFIX_CACHE_SIZE = 32
 
-    # ---------------- Gemini functions ----------------
-    def search_schemes(self, query, language="English", user_profile=None):
-        """Enhanced RAG with vectorized scheme search"""
-        # Get vectorized schemes from backend
-        relevant_schemes = self._get_vectorized_schemes(query)
-        
-        # Enhanced government services context
-        gov_context = self._get_government_services_context()
-        
-        prompt = f"""
+SEARCH_SYSTEM_INSTRUCTION: Final[str] = """
         You are an Indian Government Services Assistant. Answer directly without preambles or disclaimers.
         
-        User Query: {query}
-        Language: {language}
-        
-        Relevant Schemes Found:
-        {relevant_schemes}
-        
-        Government Services Context:
-        {gov_context}
-        
         Instructions:
         - Answer the query directly
         - List relevant schemes with eligibility and benefits
         - Include required documents and application process
         - No introductory text or disclaimers
         - Be concise and helpful
-        - Respond in {language}
+        - Respond in the language requested by the user
         """
-        
-        response = self.gemini_model.generate_content(prompt)
-        return response.text
 
-    def generate_form_help(self, fields, language="English"):
-        """Enhanced form filling assistance"""
-        prompt = f"""
+FORM_HELP_SYSTEM_INSTRUCTION: Final[str] = """
         You are a government form filling assistant for India.
         
-        Form Fields: {fields}
-        Language: {language}
-        
         Provide step-by-step guidance including:
         1. What information is needed for each field
         2. Where to find required documents
         3. Common mistakes to avoid
         4. Tips for faster processing
         
-        Be helpful and explain in simple {language}.
+        Be helpful and explain in simple terms in the language requested by the user.
+        """
+
+COMPREHENSIVE_FORM_HELP_SYSTEM_INSTRUCTION: Final[str] = """
+        You are an expert Indian government form filling assistant. Help the user fill out their form based on the OCR analysis.
+        
+        Include:
+        1. **Document Identification**: What type of form this appears to be
+        2. **Required Information**: What details are needed for each field
+        3. **Document Requirements**: Which supporting documents to prepare
+        4. **Step-by-Step Instructions**: How to fill each section
+        5. **Common Mistakes**: What errors to avoid
+        6. **Processing Tips**: How to ensure faster approval
+        
+        Make it practical and actionable. Use simple language.
         """
-        response = self.gemini_model.generate_content(prompt)
+
+GOV_CONTEXT: Final[str] = """
+        INSURANCE SERVICES:
+        - Pradhan Mantri Jeevan Jyoti Bima Yojana (Life Insurance - ₹2 lakh)
+        - Pradhan Mantri Suraksha Bima Yojana (Accident Insurance - ₹2 lakh)
+        - Pradhan Mantri Fasal Bima Yojana (Crop Insurance)
+        - Ayushman Bharat (Health Insurance - ₹5 lakh)
+        
+        HEALTHCARE SERVICES:
+        - AIIMS hospitals and government medical colleges
+        - Primary Health Centers (PHCs) and Community Health Centers
+        - Jan Aushadhi stores for affordable medicines
+        - National Health Mission programs
+        
+        EDUCATION & SCHOLARSHIPS:
+        - National Scholarship Portal (scholarships.gov.in)
+        - PM YASASVI Scheme for OBC/EBC/DNT students
+        - Post Matric Scholarship for SC/ST/OBC
+        - Merit-cum-Means Scholarship
+        
+        EMPLOYMENT & SKILLS:
+        - MGNREGA (100 days guaranteed employment)
+        - Pradhan Mantri Kaushal Vikas Yojana (Skill Development)
+        - Startup India and Stand Up India
+        - Rozgar Mela (Government job fairs)
+        
+        DIGITAL SERVICES:
+        - Aadhaar services and updates
+        - PAN card application and services
+        - Passport services (passportindia.gov.in)
+        - Driving license and vehicle registration
+        - Income/caste/domicile certificates
+        
+        FINANCIAL SERVICES:
+        - Jan Dhan Yojana (Bank accounts)
+        - PM Mudra Yojana (Business loans)
+        - Kisan Credit Card
+        - Direct Benefit Transfer (DBT)
+        
+        SOCIAL WELFARE:
+        - Public Distribution System (PDS/Ration)
+        - Widow pension schemes
+        - Disability pension and certificates
+        - Senior citizen benefits
+        """
+
+BASIC_SCHEMES: Final[str] = """
+        PM-KISAN: ₹6,000/year for farmers, Land records + Aadhaar required
+        Ayushman Bharat: ₹5 lakh health insurance for BPL families
+        PM Mudra Yojana: Business loans up to ₹10 lakh
+        MGNREGA: 100 days guaranteed employment in rural areas
+        PM Awas Yojana: Housing assistance for eligible families
+        
+        FORM FILLING GUIDANCE:
+        - Aadhaar Card: 12-digit unique identification number
+        - PAN Card: 10-character alphanumeric code for tax purposes
+        - Passport: For international travel documentation
+        - Driving License: For vehicle operation authorization
+        - Voter ID: For electoral participation
+        - Birth Certificate: Proof of birth and age
+        
+        COMMON DOCUMENTS NEEDED:
+        - Address proof (utility bills, rent agreement)
+        - Identity proof (Aadhaar, PAN, passport)
+        - Income proof (salary slips, ITR)
+        - Photographs (passport size)
+        - Bank account details
+        
+        TIPS FOR FORM FILLING:
+        - Use black or blue pen only
+        - Write in capital letters clearly
+        - Do not leave mandatory fields blank
+        - Attach all required documents
+        - Keep photocopies of all documents
+        - Verify all information before submission
+        """
+
+# Static prompt scaffolding; only the {placeholders} vary per request
+SEARCH_PROMPT_TMPL: Final[str] = """
+        User Query: {query}
+        Language: {language}
+        
+        Relevant Schemes Found:
+        {schemes}
+        
+        Respond in {language}.
+        """
+
+SCHEME_TMPL: Final[str] = """
+            Scheme: {name}
+            Overview: {overview}...
+            Eligibility: {eligibility}...
+            Benefits: {benefits}...
+            Documents: {documents}...
+            """
+
+# Offline form help when Gemini is unavailable
+FIELD_HELP = {
+    'name': "- Full Name: Write your complete name as per official documents",
+    'email': "- Email: Provide a valid email address",
+    'phone': "- Phone: 10-digit mobile number",
+    'address': "- Address: Complete postal address with PIN code",
+    'date': "- Date: Use DD/MM/YYYY format",
+}
+
+FORM_TIPS = (
+    "\nGeneral Tips:",
+    "- Use black/blue pen only",
+    "- Write clearly in capital letters",
+    "- Do not leave mandatory fields blank",
+    "- Attach required documents",
+)
+
+FORM_HELP_PROMPT_TMPL: Final[str] = """
+        Form Fields: {fields}
+        Language: {language}
+        
+        Explain in simple {language}.
+        """
+
+COMPREHENSIVE_FORM_HELP_PROMPT_TMPL: Final[str] = """
+        DOCUMENT ANALYSIS:
+        Document Type: {document_type}
+        Extracted Text: {extracted_text}...
+        
+        DETECTED FORM FIELDS:
+        {fields}
+        
+        TASK: Provide comprehensive form filling guidance in simple {language}
+        """
+
+IMAGE_ANALYSIS_PROMPT_TMPL: Final[str] = """
+Analyze this government form image and provide comprehensive form filling guidance in {language}.
+
+Please identify:
+1. What type of form this is
+2. What fields need to be filled
+3. What documents are required
+4. Step-by-step filling instructions
+5. Common mistakes to avoid
+
+Be practical and helpful. Respond in {language}.
+"""
+
+FALLBACK_ANALYSIS_PROMPT_TMPL: Final[str] = """
+I need help analyzing a government form image for form filling guidance in {language}.
+
+Please provide:
+1. General form filling tips
+2. Common document requirements
+3. Step-by-step guidance
+4. Mistakes to avoid
+
+Respond in {language}.
+"""
+
+# Prompt templates per locale; unsupported languages use English with a {language} hint
+PROMPTS: Final[dict] = {
+    "English": {
+        "search_system": SEARCH_SYSTEM_INSTRUCTION,
+        "search": SEARCH_PROMPT_TMPL,
+        "form_help_system": FORM_HELP_SYSTEM_INSTRUCTION,
+        "form_help": FORM_HELP_PROMPT_TMPL,
+        "comprehensive_form_help_system": COMPREHENSIVE_FORM_HELP_SYSTEM_INSTRUCTION,
+        "comprehensive_form_help": COMPREHENSIVE_FORM_HELP_PROMPT_TMPL,
+        "image_analysis": IMAGE_ANALYSIS_PROMPT_TMPL,
+        "fallback_analysis": FALLBACK_ANALYSIS_PROMPT_TMPL,
+    },
+    **LOCALIZED_PROMPTS,
+}
+
+# Static context cached alongside each prefix's system instruction
+PREFIX_CONTENTS: Final[dict] = {
+    "search": ["Government Services Context:\n" + GOV_CONTEXT],
+    "form_help": [],
+    "comprehensive_form_help": [],
+}
+
+# Shared async client so concurrent requests multiplex over a few HTTP/2 connections
+_HTTPX = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+)
+
+async def aclose_http_client():
+    """Close the shared async client; call once on application shutdown"""
+    await _HTTPX.aclose()
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Parse .env once per process and return (GOOGLE_API_KEY, BACKEND_URL)"""
+    load_dotenv()
+    return os.getenv("GOOGLE_API_KEY"), os.getenv("BACKEND_URL", "http://localhost:5000")
+
+class RAGService:
+    def __init__(self, image_max_edge=1024, image_quality=85):
+        gemini_key, self.backend_url = _load_env()
+
+        # ---- Gemini Setup ----
+        if not gemini_key:
+            raise ValueError("GOOGLE_API_KEY not found in environment variables")
+        genai.configure(api_key=gemini_key)
+        
+        # Form images are downscaled and re-encoded before upload to Gemini
+        self.image_max_edge = image_max_edge
+        self.image_quality = image_quality
+        
+        # Invariant prompt prefixes are registered with Gemini context caching on first use;
+        # sha256(prefix) -> (model, CachedContent or None), in LRU order
+        self._prefix_models = OrderedDict()
+        self._prefix_lock = threading.Lock()
+        
+        # Responses for repeated / paraphrased queries
+        self._sem_cache = SemanticCache(
+            threshold=float(os.getenv("RAG_CACHE_SIMILARITY", "0.93")),
+            ttl_seconds=int(os.getenv("RAG_CACHE_TTL", "3600")),
+            cache_dir=os.getenv("RAG_CACHE_DIR"),
+        )
+        
+        # Ranked fallback when the scheme backend is unreachable
+        self._fallback_index = LocalSchemeIndex()
+        
+        # Keep-alive connection pool to the scheme backend
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers.update({"Connection": "keep-alive", "Content-Type": "application/json"})
+
+    def close(self):
+        """Release this instance's pooled backend connections"""
+        self._http.close()
+
+    @functools.cached_property
+    def gemini_model(self):
+        """Plain Gemini model, constructed on first use"""
+        return genai.GenerativeModel('gemini-1.5-flash')
+
+    @property
+    def gemini_vision_model(self):
+        """gemini-1.5-flash is multimodal, so vision calls share the same model"""
+        return self.gemini_model
+
+    # ---------------- Gemini functions ----------------
+    def search_schemes(self, query, language="English", user_profile=None):
+        """Enhanced RAG with vectorized scheme search"""
+        cached = self._sem_cache.get(query, language)
+        if cached is not None:
+            return cached
+        
+        # Get vectorized schemes from backend
+        relevant_schemes = self._get_vectorized_schemes(query)
+        
+        prompt = self._build_search_prompt(query, language, relevant_schemes)
+        response = self._generate_with_prefix("search", language, prompt)
+        self._sem_cache.set(query, language, response.text)
+        return response.text
+
+    async def search_schemes_async(self, query, language="English", user_profile=None):
+        """Async version of search_schemes that overlaps the backend fetch with the cache lookup"""
+        loop = asyncio.get_running_loop()
+        schemes_task = asyncio.create_task(self._get_vectorized_schemes_async(query))
+        
+        cached = await loop.run_in_executor(None, self._sem_cache.get, query, language)
+        if cached is not None:
+            schemes_task.cancel()
+            return cached
+        
+        relevant_schemes = await schemes_task
+        prompt = self._build_search_prompt(query, language, relevant_schemes)
+        response = await self._generate_with_prefix_async("search", language, prompt)
+        await loop.run_in_executor(None, self._sem_cache.set, query, language, response.text)
+        return response.text
+
+    def search_schemes_stream(self, query, language="English", user_profile=None):
+        """Streaming version of search_schemes that yields text chunks as Gemini produces them"""
+        cached = self._sem_cache.get(query, language)
+        if cached is not None:
+            yield cached
+            return
+        
+        relevant_schemes = self._get_vectorized_schemes(query)
+        prompt = self._build_search_prompt(query, language, relevant_schemes)
+        
+        chunks = []
+        for chunk in self._generate_with_prefix("search", language, prompt, stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
+        self._sem_cache.set(query, language, "".join(chunks))
+
+    def generate_form_help(self, fields, language="English"):
+        """Enhanced form filling assistance"""
+        prompt = self._templates(language)["form_help"].format_map({"fields": fields, "language": language})
+        response = self._generate_with_prefix("form_help", language, prompt)
         return response.text
     
     def generate_comprehensive_form_help(self, extracted_text, detected_fields, document_type, language="English"):
@@ -81,31 +386,15 @@ class RAGService:
         
         fields_text = "\n".join(fields_info) if fields_info else "No specific fields detected"
         
-        prompt = f"""
-        You are an expert Indian government form filling assistant. Help the user fill out this form based on the OCR analysis.
-        
-        DOCUMENT ANALYSIS:
-        Document Type: {document_type}
-        Extracted Text: {extracted_text[:500]}...
-        
-        DETECTED FORM FIELDS:
-        {fields_text}
-        
-        TASK: Provide comprehensive form filling guidance in {language}
-        
-        Include:
-        1. **Document Identification**: What type of form this appears to be
-        2. **Required Information**: What details are needed for each field
-        3. **Document Requirements**: Which supporting documents to prepare
-        4. **Step-by-Step Instructions**: How to fill each section
-        5. **Common Mistakes**: What errors to avoid
-        6. **Processing Tips**: How to ensure faster approval
-        
-        Make it practical and actionable. Use simple {language}.
-        """
+        prompt = self._templates(language)["comprehensive_form_help"].format_map({
+            "document_type": document_type,
+            "extracted_text": extracted_text[:500],
+            "fields": fields_text,
+            "language": language,
+        })
         
         try:
-            response = self.gemini_model.generate_content(prompt)
+            response = self._generate_with_prefix("comprehensive_form_help", language, prompt)
             return response.text
         except Exception as e:
             print(f"RAG service error: {e}")
@@ -119,39 +408,41 @@ class RAGService:
     def analyze_form_image_directly(self, image_data, language="English"):
         """Analyze form image directly using Gemini Vision"""
         try:
-            import base64
             from PIL import Image
             import io
             
             # Handle base64 image data
+            header = None
             if isinstance(image_data, str) and image_data.startswith('data:image'):
                 header, base64_data = image_data.split(',', 1)
-                image_bytes = base64.b64decode(base64_data)
+                image_bytes = base64.b64decode(base64_data, validate=False)
             elif isinstance(image_data, str):
-                image_bytes = base64.b64decode(image_data)
+                image_bytes = base64.b64decode(image_data, validate=False)
             else:
                 image_bytes = image_data
             
-            # Convert to PIL Image and ensure RGB format
+            # Image.open only parses the header here; pixels are decoded on demand
             image = Image.open(io.BytesIO(image_bytes))
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            mime_type = self._detect_image_mime(header, image_bytes)
             
-            prompt = f"""
-Analyze this government form image and provide comprehensive form filling guidance in {language}.
-
-Please identify:
-1. What type of form this is
-2. What fields need to be filled
-3. What documents are required
-4. Step-by-step filling instructions
-5. Common mistakes to avoid
-
-Be practical and helpful. Respond in {language}.
-"""
+            if (mime_type and image.mode in ('RGB', 'L')
+                    and max(image.size) <= self.image_max_edge):
+                # Already small and in a format Gemini accepts: send the original bytes
+                image_part = {'mime_type': mime_type, 'data': image_bytes}
+            else:
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                
+                # Shrink phone-camera photos to cut upload bytes and vision tokens
+                image.thumbnail((self.image_max_edge, self.image_max_edge), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                image.save(buffer, 'JPEG', quality=self.image_quality, optimize=True)
+                image_part = {'mime_type': 'image/jpeg', 'data': buffer.getvalue()}
+            
+            prompt = self._templates(language)["image_analysis"].format_map({"language": language})
             
             # Use vision model with proper content format
-            response = self.gemini_vision_model.generate_content([prompt, image])
+            response = self.gemini_vision_model.generate_content([prompt, image_part])
             return response.text
             
         except Exception as e:
@@ -164,50 +455,21 @@ Be practical and helpful. Respond in {language}.
     
     def _generate_simple_form_help(self, fields, doc_type, language="English"):
         """Simple fallback form help without AI"""
-        help_parts = []
-        help_parts.append(f"Form Type: {doc_type.replace('_', ' ').title()}")
-        help_parts.append("\nRequired Information:")
-        
-        for field in fields:
-            field_type = field.get('type', 'text')
-            if field_type == 'name':
-                help_parts.append("- Full Name: Write your complete name as per official documents")
-            elif field_type == 'email':
-                help_parts.append("- Email: Provide a valid email address")
-            elif field_type == 'phone':
-                help_parts.append("- Phone: 10-digit mobile number")
-            elif field_type == 'address':
-                help_parts.append("- Address: Complete postal address with PIN code")
-            elif field_type == 'date':
-                help_parts.append("- Date: Use DD/MM/YYYY format")
-            else:
-                help_parts.append(f"- {field.get('field', 'Field')}: Fill accurately")
-        
-        help_parts.append("\nGeneral Tips:")
-        help_parts.append("- Use black/blue pen only")
-        help_parts.append("- Write clearly in capital letters")
-        help_parts.append("- Do not leave mandatory fields blank")
-        help_parts.append("- Attach required documents")
-        
-        return "\n".join(help_parts)
+        return "\n".join([
+            f"Form Type: {doc_type.replace('_', ' ').title()}",
+            "\nRequired Information:",
+            *(
+                FIELD_HELP.get(field.get('type', 'text')) or f"- {field.get('field', 'Field')}: Fill accurately"
+                for field in fields
+            ),
+            *FORM_TIPS,
+        ])
     
     def _analyze_with_fallback(self, image_data, language="English"):
         """Fallback image analysis method"""
         try:
-            import base64
-            
             # Simple text-based analysis
-            prompt = f"""
-I need help analyzing a government form image for form filling guidance in {language}.
-
-Please provide:
-1. General form filling tips
-2. Common document requirements
-3. Step-by-step guidance
-4. Mistakes to avoid
-
-Respond in {language}.
-"""
+            prompt = self._templates(language)["fallback_analysis"].format_map({"language": language})
             
             response = self.gemini_model.generate_content(prompt)
             return response.text
@@ -220,116 +482,207 @@ Respond in {language}.
         return self.search_schemes(query, language)
 
     # ---------------- Helpers ----------------
+    def _build_cached_model(self, system_instruction, contents):
+        """Register an invariant prompt prefix with Gemini context caching.
+
+        Returns (model, cached_content). Prefixes below the API's minimum
+        cacheable token count, or whose cache cannot be created, get a plain
+        model carrying the prefix as its system instruction and no cached
+        content.
+        """
+        plain_model = genai.GenerativeModel(
+            'gemini-1.5-flash',
+            system_instruction="\n".join([system_instruction, *contents]),
+        )
+        if not self._is_cacheable(system_instruction, contents):
+            return plain_model, None
+        
+        try:
+            cached = genai.caching.CachedContent.create(
+                model=CACHE_MODEL_NAME,
+                system_instruction=system_instruction,
+                contents=contents or None,
+                ttl=CACHE_TTL,
+            )
+            return genai.GenerativeModel.from_cached_content(cached), cached
+        except Exception as e:
+            print(f"Context cache unavailable, using system instruction: {e}")
+            return plain_model, None
+
+    def _is_cacheable(self, system_instruction, contents):
+        """Whether the prefix reaches Gemini's minimum size for context caching"""
+        # A token covers at least one UTF-8 byte, so shorter prefixes can be ruled out offline
+        size = sum(len(part.encode("utf-8")) for part in [system_instruction, *contents])
+        if size < CACHE_MIN_TOKENS:
+            return False
+        try:
+            counter = genai.GenerativeModel(CACHE_MODEL_NAME, system_instruction=system_instruction)
+            return counter.count_tokens(contents or "").total_tokens >= CACHE_MIN_TOKENS
+        except Exception as e:
+            print(f"Token count failed, skipping context cache: {e}")
+            return False
+
+    def _detect_image_mime(self, header, image_bytes):
+        """MIME type from the data URL header or magic bytes, if Gemini accepts it as-is"""
+        if header:
+            mime_type = header[len('data:'):].split(';', 1)[0]
+            if mime_type in GEMINI_IMAGE_MIME_TYPES:
+                return mime_type
+        for magic, mime_type in IMAGE_MAGIC_BYTES:
+            if image_bytes.startswith(magic):
+                return mime_type
+        if image_bytes[:4] == b'RIFF' and image_bytes[8:12] == b'WEBP':
+            return 'image/webp'
+        return None
+
+    def _build_search_prompt(self, query, language, relevant_schemes):
+        """Variable part of the search prompt; context and instructions live in the cached prefix"""
+        return self._templates(language)["search"].format_map({
+            "query": query,
+            "language": language,
+            "schemes": relevant_schemes,
+        })
+
+    def _templates(self, language):
+        """Prompt templates for the language, falling back to English"""
+        return PROMPTS.get(language, PROMPTS["English"])
+
+    def _prefix(self, name, language):
+        """(system_instruction, contents) for the named prefix in the given language"""
+        return self._templates(language)[f"{name}_system"], PREFIX_CONTENTS[name]
+
+    def _prefix_key(self, prefix):
+        """SHA-256 of the canonicalized prefix, so identical prefixes share one cache"""
+        system_instruction, contents = prefix
+        canonical = "\x00".join(part.strip() for part in [system_instruction, *contents])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _get_prefix_model(self, name, language):
+        """(model, CachedContent or None) for the named prefix, built on first use"""
+        prefix = self._prefix(name, language)
+        key = self._prefix_key(prefix)
+        with self._prefix_lock:
+            entry = self._prefix_models.get(key)
+            if entry is not None:
+                self._prefix_models.move_to_end(key)
+                return entry
+        
+        built = self._build_cached_model(*prefix)
+        stale = []
+        with self._prefix_lock:
+            entry = self._prefix_models.get(key)
+            if entry is not None:
+                # Another thread built this prefix first; keep theirs and discard ours
+                self._prefix_models.move_to_end(key)
+                stale.append(built)
+            else:
+                entry = self._prefix_models[key] = built
+                while len(self._prefix_models) > PREFIX_CACHE_SIZE:
+                    stale.append(self._prefix_models.popitem(last=False)[1])
+        
+        for _, cached in stale:
+            self._delete_cached(cached)
+        return entry
+
+    def _drop_prefix_model(self, name, language):
+        """Forget an expired prefix so the next call recreates it"""
+        with self._prefix_lock:
+            entry = self._prefix_models.pop(self._prefix_key(self._prefix(name, language)), None)
+        if entry is not None:
+            self._delete_cached(entry[1])
+
+    def _delete_cached(self, cached):
+        """Delete a CachedContent so it stops accruing storage"""
+        if cached is None:
+            return
+        try:
+            cached.delete()
+        except Exception as e:
+            print(f"Failed to delete cached prefix: {e}")
+
+    def _generate_with_prefix(self, name, language, prompt, **kwargs):
+        """Generate content on top of a cached prefix, recreating it once if it expired"""
+        model, cached = self._get_prefix_model(name, language)
+        try:
+            return model.generate_content(prompt, **kwargs)
+        except google_exceptions.NotFound as e:
+            # Only an expired CachedContent is recoverable; other errors (e.g. 429) propagate
+            if cached is None:
+                raise
+            print(f"Cached prefix '{name}' expired, refreshing: {e}")
+            self._drop_prefix_model(name, language)
+            model, _ = self._get_prefix_model(name, language)
+            return model.generate_content(prompt, **kwargs)
+
+    async def _generate_with_prefix_async(self, name, language, prompt):
+        """Async version of _generate_with_prefix"""
+        # Building a prefix may call the Gemini API synchronously; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        model, cached = await loop.run_in_executor(None, self._get_prefix_model, name, language)
+        try:
+            return await model.generate_content_async(prompt)
+        except google_exceptions.NotFound as e:
+            if cached is None:
+                raise
+            print(f"Cached prefix '{name}' expired, refreshing: {e}")
+            await loop.run_in_executor(None, self._drop_prefix_model, name, language)
+            model, _ = await loop.run_in_executor(None, self._get_prefix_model, name, language)
+            return await model.generate_content_async(prompt)
+
     def _get_vectorized_schemes(self, query):
         """Fetch relevant schemes using vector search"""
         try:
-            response = requests.post(
+            response = self._http.post(
                 f"{self.backend_url}/api/v1/schemes/search",
-                json={"query": query},
+                data=orjson.dumps({"query": query}),
                 timeout=10
             )
             if response.status_code == 200:
-                schemes = response.json().get("schemes", [])
+                schemes = orjson.loads(response.content).get("schemes", [])
                 return self._format_schemes_for_context(schemes)
         except Exception as e:
             print(f"Vector search failed: {e}")
         
-        # Fallback to basic schemes data
-        return self._get_basic_schemes_data()
+        # Fallback to locally ranked schemes
+        return self._get_local_schemes(query)
+
+    async def _get_vectorized_schemes_async(self, query):
+        """Async version of _get_vectorized_schemes"""
+        try:
+            response = await _HTTPX.post(
+                f"{self.backend_url}/api/v1/schemes/search",
+                content=orjson.dumps({"query": query}),
+                headers={"Content-Type": "application/json"},
+            )
+            if response.status_code == 200:
+                schemes = orjson.loads(response.content).get("schemes", [])
+                return self._format_schemes_for_context(schemes)
+        except Exception as e:
+            print(f"Vector search failed: {e}")
+        
+        # Fallback to locally ranked schemes
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_local_schemes, query)
+    
+    def _get_local_schemes(self, query):
+        """Rank the bundled schemes for the query, or fall back to the static summary"""
+        schemes = self._fallback_index.search(query, top_k=5)
+        if not schemes:
+            return BASIC_SCHEMES
+        return self._format_schemes_for_context(schemes)
     
     def _format_schemes_for_context(self, schemes):
         """Format schemes data for AI context"""
         if not schemes:
             return "No specific schemes found for this query."
         
-        formatted = []
-        for scheme in schemes[:5]:  # Limit to top 5
-            formatted.append(f"""
-            Scheme: {scheme.get('name', 'N/A')}
-            Overview: {scheme.get('overview', 'N/A')[:200]}...
-            Eligibility: {scheme.get('eligibility', 'N/A')[:150]}...
-            Benefits: {scheme.get('benefits', 'N/A')[:150]}...
-            Documents: {scheme.get('documents', 'N/A')[:100]}...
-            """)
-        
-        return "\n".join(formatted)
-    
-    def _get_government_services_context(self):
-        """Universal government services knowledge base"""
-        return """
-        INSURANCE SERVICES:
-        - Pradhan Mantri Jeevan Jyoti Bima Yojana (Life Insurance - ₹2 lakh)
-        - Pradhan Mantri Suraksha Bima Yojana (Accident Insurance - ₹2 lakh)
-        - Pradhan Mantri Fasal Bima Yojana (Crop Insurance)
-        - Ayushman Bharat (Health Insurance - ₹5 lakh)
-        
-        HEALTHCARE SERVICES:
-        - AIIMS hospitals and government medical colleges
-        - Primary Health Centers (PHCs) and Community Health Centers
-        - Jan Aushadhi stores for affordable medicines
-        - National Health Mission programs
-        
-        EDUCATION & SCHOLARSHIPS:
-        - National Scholarship Portal (scholarships.gov.in)
-        - PM YASASVI Scheme for OBC/EBC/DNT students
-        - Post Matric Scholarship for SC/ST/OBC
-        - Merit-cum-Means Scholarship
-        
-        EMPLOYMENT & SKILLS:
-        - MGNREGA (100 days guaranteed employment)
-        - Pradhan Mantri Kaushal Vikas Yojana (Skill Development)
-        - Startup India and Stand Up India
-        - Rozgar Mela (Government job fairs)
-        
-        DIGITAL SERVICES:
-        - Aadhaar services and updates
-        - PAN card application and services
-        - Passport services (passportindia.gov.in)
-        - Driving license and vehicle registration
-        - Income/caste/domicile certificates
-        
-        FINANCIAL SERVICES:
-        - Jan Dhan Yojana (Bank accounts)
-        - PM Mudra Yojana (Business loans)
-        - Kisan Credit Card
-        - Direct Benefit Transfer (DBT)
-        
-        SOCIAL WELFARE:
-        - Public Distribution System (PDS/Ration)
-        - Widow pension schemes
-        - Disability pension and certificates
-        - Senior citizen benefits
-        """
-    
-    def _get_basic_schemes_data(self):
-        """Fallback schemes data when vector search fails"""
-        return """
-        PM-KISAN: ₹6,000/year for farmers, Land records + Aadhaar required
-        Ayushman Bharat: ₹5 lakh health insurance for BPL families
-        PM Mudra Yojana: Business loans up to ₹10 lakh
-        MGNREGA: 100 days guaranteed employment in rural areas
-        PM Awas Yojana: Housing assistance for eligible families
-        
-        FORM FILLING GUIDANCE:
-        - Aadhaar Card: 12-digit unique identification number
-        - PAN Card: 10-character alphanumeric code for tax purposes
-        - Passport: For international travel documentation
-        - Driving License: For vehicle operation authorization
-        - Voter ID: For electoral participation
-        - Birth Certificate: Proof of birth and age
-        
-        COMMON DOCUMENTS NEEDED:
-        - Address proof (utility bills, rent agreement)
-        - Identity proof (Aadhaar, PAN, passport)
-        - Income proof (salary slips, ITR)
-        - Photographs (passport size)
-        - Bank account details
-        
-        TIPS FOR FORM FILLING:
-        - Use black or blue pen only
-        - Write in capital letters clearly
-        - Do not leave mandatory fields blank
-        - Attach all required documents
-        - Keep photocopies of all documents
-        - Verify all information before submission
-        """
\ No newline at end of file
+        return "\n".join(
+            SCHEME_TMPL.format(
+                name=scheme.get('name') or 'N/A',
+                overview=(scheme.get('overview') or 'N/A')[:200],
+                eligibility=(scheme.get('eligibility') or 'N/A')[:150],
+                benefits=(scheme.get('benefits') or 'N/A')[:150],
+                documents=(scheme.get('documents') or 'N/A')[:100],
+            )
+            for scheme in schemes[:5]  # Limit to top 5
+        )
@@ -0,0 +1,202 @@
+import re
+import threading
+
+from app.services.semantic_cache import HAS_EMBEDDINGS, get_embedding_model
+
+if HAS_EMBEDDINGS:
+    import numpy as np
+
+STOPWORDS = {
+    "the", "and", "for", "with", "from", "who", "what", "how", "are", "can",
+    "get", "per", "any", "all", "about", "scheme", "schemes", "yojana", "tell",
+}
+
+# Well-known central schemes, in the same shape as the backend search results
+FALLBACK_SCHEMES = [
+    {
+        "name": "PM-KISAN",
+        "overview": "Income support of ₹6,000 per year to landholding farmer families, paid in three instalments by direct benefit transfer.",
+        "eligibility": "Landholding farmer families; income tax payers and institutional landholders are excluded.",
+        "benefits": "₹2,000 every four months directly into the bank account.",
+        "documents": "Aadhaar, land records, bank account details",
+    },
+    {
+        "name": "Ayushman Bharat (PM-JAY)",
+        "overview": "Health insurance cover of ₹5 lakh per family per year for secondary and tertiary hospitalisation.",
+        "eligibility": "Poor and vulnerable families identified from SECC data, and senior citizens aged 70 and above.",
+        "benefits": "Cashless treatment at empanelled government and private hospitals.",
+        "documents": "Aadhaar, ration card, Ayushman card",
+    },
+    {
+        "name": "Pradhan Mantri Jeevan Jyoti Bima Yojana (PMJJBY)",
+        "overview": "Life insurance cover of ₹2 lakh renewable every year.",
+        "eligibility": "Age 18-50 with a savings bank or post office account.",
+        "benefits": "₹2 lakh paid to the nominee on death due to any cause, for a premium of ₹436 per year.",
+        "documents": "Bank account, Aadhaar, nominee details",
+    },
+    {
+        "name": "Pradhan Mantri Suraksha Bima Yojana (PMSBY)",
+        "overview": "Accident insurance cover renewable every year.",
+        "eligibility": "Age 18-70 with a savings bank or post office account.",
+        "benefits": "₹2 lakh for accidental death or full disability, ₹1 lakh for partial disability, for a premium of ₹20 per year.",
+        "documents": "Bank account, Aadhaar, nominee details",
+    },
+    {
+        "name": "Pradhan Mantri Fasal Bima Yojana (PMFBY)",
+        "overview": "Crop insurance against yield loss from natural calamities, pests and diseases.",
+        "eligibility": "All farmers growing notified crops, including sharecroppers and tenant farmers.",
+        "benefits": "Low farmer premium: 2% for kharif, 1.5% for rabi, 5% for commercial and horticulture crops.",
+        "documents": "Land records or tenancy agreement, sowing certificate, Aadhaar, bank account",
+    },
+    {
+        "name": "Kisan Credit Card (KCC)",
+        "overview": "Short-term credit for crop cultivation, animal husbandry and fisheries.",
+        "eligibility": "Farmers, tenant farmers, sharecroppers, fishers and animal husbandry farmers.",
+        "benefits": "Revolving credit at subsidised interest with additional relief for prompt repayment.",
+        "documents": "Land records, identity proof, address proof, passport size photograph",
+    },
+    {
+        "name": "MGNREGA",
+        "overview": "Guaranteed wage employment for rural households.",
+        "eligibility": "Adult members of rural households willing to do unskilled manual work.",
+        "benefits": "Up to 100 days of paid work per household per year, wages paid to the bank account.",
+        "documents": "Job card, Aadhaar, bank account details",
+    },
+    {
+        "name": "Pradhan Mantri Awas Yojana (PMAY)",
+        "overview": "Housing assistance to build or buy a pucca house, in urban and rural (Gramin) variants.",
+        "eligibility": "Families without a pucca house, in EWS, LIG and MIG income categories.",
+        "benefits": "Construction assistance in rural areas and interest subsidy on home loans in urban areas.",
+        "documents": "Aadhaar, income certificate, property documents, bank account details",
+    },
+    {
+        "name": "PM Mudra Yojana",
+        "overview": "Collateral-free loans for non-farm micro and small enterprises.",
+        "eligibility": "Individuals, proprietors and partnerships running or starting a small business.",
+        "benefits": "Loans under Shishu, Kishore and Tarun categories up to ₹10 lakh.",
+        "documents": "Identity proof, address proof, business plan or proof of business, bank statements",
+    },
+    {
+        "name": "Stand Up India",
+        "overview": "Bank loans for setting up greenfield enterprises.",
+        "eligibility": "SC/ST and women entrepreneurs aged 18 and above.",
+        "benefits": "Loans between ₹10 lakh and ₹1 crore for manufacturing, services, trading or agri-allied activities.",
+        "documents": "Identity proof, caste certificate where applicable, project report, address proof",
+    },
+    {
+        "name": "Pradhan Mantri Kaushal Vikas Yojana (PMKVY)",
+        "overview": "Free short-term skill training and certification.",
+        "eligibility": "Indian youth aged 15-45, school or college dropouts and the unemployed.",
+        "benefits": "Industry-recognised certificate and placement assistance.",
+        "documents": "Aadhaar, educational certificates, bank account details",
+    },
+    {
+        "name": "Post Matric Scholarship for SC Students",
+        "overview": "Scholarship for SC students studying at post-matriculation level, applied through the National Scholarship Portal.",
+        "eligibility": "SC students with annual family income up to ₹2.5 lakh.",
+        "benefits": "Tuition and compulsory fees plus an academic allowance.",
+        "documents": "Caste certificate, income certificate, previous marksheet, fee receipt, bank account",
+    },
+    {
+        "name": "PM YASASVI",
+        "overview": "Scholarships for OBC, EBC and DNT students at pre-matric, post-matric and top-class school levels.",
+        "eligibility": "OBC/EBC/DNT students with annual family income up to ₹2.5 lakh.",
+        "benefits": "Scholarship amounts credited through the National Scholarship Portal.",
+        "documents": "Caste certificate, income certificate, marksheet, Aadhaar, bank account",
+    },
+    {
+        "name": "Pradhan Mantri Jan Dhan Yojana",
+        "overview": "Basic savings bank account for every household.",
+        "eligibility": "Any Indian citizen aged 10 and above without a bank account.",
+        "benefits": "Zero-balance account, RuPay debit card with accident cover, and overdraft facility.",
+        "documents": "Aadhaar or any officially valid document, photograph",
+    },
+    {
+        "name": "Atal Pension Yojana",
+        "overview": "Guaranteed pension scheme for workers in the unorganised sector.",
+        "eligibility": "Age 18-40 with a savings bank account; income tax payers are excluded.",
+        "benefits": "Monthly pension of ₹1,000 to ₹5,000 after age 60, depending on contribution.",
+        "documents": "Bank account, Aadhaar, mobile number",
+    },
+    {
+        "name": "Sukanya Samriddhi Yojana",
+        "overview": "Small savings scheme for the education and marriage of a girl child.",
+        "eligibility": "Girl child below 10 years of age; account opened by a parent or guardian.",
+        "benefits": "High fixed interest rate with tax benefits under Section 80C.",
+        "documents": "Birth certificate of the girl, parent identity and address proof",
+    },
+    {
+        "name": "National Social Assistance Programme (NSAP)",
+        "overview": "Monthly pensions for the elderly, widows and persons with disabilities.",
+        "eligibility": "Below poverty line senior citizens, widows and persons with severe disability.",
+        "benefits": "Monthly pension through Indira Gandhi old age, widow and disability pension schemes.",
+        "documents": "Age proof, BPL card, death certificate of spouse or disability certificate, bank account",
+    },
+    {
+        "name": "Public Distribution System (PMGKAY)",
+        "overview": "Free food grains through ration shops under the National Food Security Act.",
+        "eligibility": "Priority households and Antyodaya Anna Yojana ration card holders.",
+        "benefits": "5 kg of free food grains per person per month; 35 kg per AAY household.",
+        "documents": "Ration card, Aadhaar",
+    },
+    {
+        "name": "Pradhan Mantri Bhartiya Janaushadhi Pariyojana",
+        "overview": "Quality generic medicines at affordable prices through Jan Aushadhi stores.",
+        "eligibility": "Open to everyone.",
+        "benefits": "Generic medicines typically 50-90% cheaper than branded equivalents.",
+        "documents": "Doctor's prescription",
+    },
+]
+
+
+class LocalSchemeIndex:
+    """In-process ranked search over FALLBACK_SCHEMES for when the backend is down.
+
+    Uses cosine similarity over sentence-transformer embeddings when
+    available, otherwise keyword overlap.
+    """
+
+    def __init__(self, schemes=FALLBACK_SCHEMES, min_similarity=0.2):
+        self.schemes = schemes
+        self.min_similarity = min_similarity
+        self._docs = [
+            " ".join(scheme.get(key, "") for key in ("name", "overview", "eligibility", "benefits"))
+            for scheme in schemes
+        ]
+        self._tokens = [set(self._tokenize(doc)) for doc in self._docs]
+        self._lock = threading.Lock()
+        self._vectors = None
+
+    def search(self, query, top_k=5):
+        """Return up to top_k schemes relevant to the query, best first"""
+        vectors = self._get_vectors()
+        if vectors is not None:
+            try:
+                q_emb = get_embedding_model().encode(query, normalize_embeddings=True)
+                scores = vectors @ q_emb
+                ranked = np.argsort(scores)[::-1][:top_k]
+                return [self.schemes[i] for i in ranked if scores[i] >= self.min_similarity]
+            except Exception as e:
+                print(f"Local scheme embedding search failed: {e}")
+
+        query_tokens = set(self._tokenize(query))
+        scores = [len(query_tokens & tokens) for tokens in self._tokens]
+        ranked = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:top_k]
+        return [self.schemes[i] for i in ranked if scores[i] > 0]
+
+    # ---------------- Helpers ----------------
+    def _tokenize(self, text):
+        return [token for token in re.findall(r"\w+", text.lower()) if len(token) > 2 and token not in STOPWORDS]
+
+    def _get_vectors(self):
+        """Scheme embeddings, computed once on first use"""
+        if not HAS_EMBEDDINGS:
+            return None
+        with self._lock:
+            if self._vectors is None:
+                try:
+                    self._vectors = get_embedding_model().encode(self._docs, normalize_embeddings=True)
+                except Exception as e:
+                    print(f"Scheme embedding failed: {e}")
+                    return None
+            return self._vectors
@@ -0,0 +1,216 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import orjson
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    HAS_EMBEDDINGS = True
+except ImportError:
+    HAS_EMBEDDINGS = False
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Minimum seconds between sweeps of the on-disk cache
+DISK_PRUNE_INTERVAL = 60
+
+_embedding_model = None
+_embedding_lock = threading.Lock()
+
+
+def get_embedding_model():
+    """Shared sentence-transformer, loaded once per process"""
+    global _embedding_model
+    with _embedding_lock:
+        if _embedding_model is None:
+            _embedding_model = SentenceTransformer(EMBEDDING_MODEL)
+        return _embedding_model
+
+
+class SemanticCache:
+    """In-process response cache keyed by query similarity.
+
+    Exact (normalized) repeats are always served from a dict. When
+    sentence-transformers is installed, paraphrased queries whose
+    embeddings are within `threshold` cosine similarity also hit.
+
+    With `cache_dir` set, exact entries are also persisted as one file per
+    key so they survive restarts and are shared between worker processes.
+    The directory is swept periodically on write: expired files are removed
+    and at most `max_entries` of the newest are kept.
+    """
+
+    def __init__(self, threshold=0.93, ttl_seconds=3600, max_entries=1000, cache_dir=None):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._exact = {}
+        self._vectors = None
+        self._entries = []
+        self._last_embedding = (None, None)
+        self._last_prune = 0.0
+
+    def get(self, query, language):
+        """Return a cached response for the query, or None"""
+        key = self._key(query, language)
+        now = time.time()
+
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry and entry["expires"] > now:
+                return entry["text"]
+
+        entry = self._read_disk(key)
+        if entry and entry["expires"] > now:
+            with self._lock:
+                self._exact[key] = entry
+            return entry["text"]
+
+        embedding = self._embed(query)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            if self._vectors is None or not self._entries:
+                return None
+            scores = self._vectors @ embedding
+            for idx in np.argsort(scores)[::-1]:
+                if scores[idx] < self.threshold:
+                    break
+                entry = self._entries[idx]
+                if entry["lang"] == language and entry["expires"] > now:
+                    return entry["text"]
+        return None
+
+    def set(self, query, language, text):
+        """Store a response for the query"""
+        entry = {"lang": language, "text": text, "expires": time.time() + self.ttl_seconds}
+        embedding = self._embed(query)
+
+        key = self._key(query, language)
+        self._write_disk(key, entry)
+
+        with self._lock:
+            self._exact[key] = entry
+            if embedding is not None:
+                if self._vectors is None:
+                    self._vectors = embedding[None, :]
+                else:
+                    self._vectors = np.vstack([self._vectors, embedding])
+                self._entries.append(entry)
+            self._evict()
+
+    # ---------------- Helpers ----------------
+    def _key(self, query, language):
+        return (language, " ".join(query.lower().split()))
+
+    def _disk_path(self, key):
+        digest = hashlib.sha256("\x00".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _read_disk(self, key):
+        """Load a persisted entry, deleting it if expired"""
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if entry.get("expires", 0) <= time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key, entry):
+        """Persist an entry atomically so concurrent workers never read a partial file"""
+        if not self.cache_dir:
+            return
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            print(f"Response cache write failed: {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        if time.time() - self._last_prune >= DISK_PRUNE_INTERVAL:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove expired and stray temp files, then the oldest entries beyond max_entries"""
+        self._last_prune = now = time.time()
+        kept = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    try:
+                        mtime = item.stat().st_mtime
+                        if item.name.endswith(".tmp"):
+                            # Left behind by a writer that died; live writes finish within seconds
+                            if mtime + DISK_PRUNE_INTERVAL <= now:
+                                os.remove(item.path)
+                        elif item.name.endswith(".json"):
+                            if mtime + self.ttl_seconds <= now:
+                                os.remove(item.path)
+                            else:
+                                kept.append((mtime, item.path))
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Response cache prune failed: {e}")
+            return
+
+        kept.sort()
+        for _, path in kept[:max(0, len(kept) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _embed(self, query):
+        """Unit-normalized query embedding, or None when embeddings are unavailable"""
+        if not HAS_EMBEDDINGS:
+            return None
+        # get() followed by set() on a miss embeds the same query twice
+        last_query, last_embedding = self._last_embedding
+        if last_query == query:
+            return last_embedding
+        try:
+            embedding = get_embedding_model().encode(query, normalize_embeddings=True).astype(np.float32)
+            self._last_embedding = (query, embedding)
+            return embedding
+        except Exception as e:
+            print(f"Query embedding failed: {e}")
+            return None
+
+    def _evict(self):
+        """Drop expired entries, then the oldest ones beyond max_entries"""
+        now = time.time()
+        self._exact = {k: v for k, v in self._exact.items() if v["expires"] > now}
+        while len(self._exact) > self.max_entries:
+            self._exact.pop(next(iter(self._exact)))
+
+        if self._entries:
+            keep = [i for i, e in enumerate(self._entries) if e["expires"] > now]
+            keep = keep[-self.max_entries:]
+            if len(keep) != len(self._entries):
+                self._entries = [self._entries[i] for i in keep]
+                self._vectors = self._vectors[keep] if keep else None
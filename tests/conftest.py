@@ -0,0 +1,38 @@
+"""
+Shared, session-scoped service fixtures so each service is built once per run
+
+Services are imported inside their fixtures so pure-logic tests run without
+every service's dependencies installed.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope="session")
+def ocr():
+    from app.services.ocr_service import OCRService
+    return OCRService()
+
+
+@pytest.fixture(scope="session")
+def rag():
+    from app.services.rag_service import RAGService
+    # Tests stub out Gemini calls, so any key will do
+    os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+    return RAGService()
+
+
+@pytest.fixture(scope="session")
+def translation():
+    from app.services.translation_service import TranslationService
+    return TranslationService()
+
+
+@pytest.fixture(scope="session")
+def tts():
+    from app.services.tts_service import TTSService
+    return TTSService()
@@ -0,0 +1,65 @@
+"""
+Form analysis pipeline tests
+
+Install test dependencies with: pip install -r requirements-dev.txt
+Run with: pytest tests/ (add -n auto to parallelize)
+"""
+from types import SimpleNamespace
+
+# 1x1 white pixel
+TEST_IMAGE = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+
+
+def test_ocr_extracts_from_data_url(ocr):
+    result = ocr.extract_text_from_image(TEST_IMAGE)
+    assert "error" not in result
+    assert {"text", "fields", "document_type"} <= result.keys()
+
+
+def test_rag_comprehensive_form_help(rag, monkeypatch):
+    calls = []
+
+    def fake_generate(name, language, prompt, **kwargs):
+        calls.append((name, language, prompt))
+        return SimpleNamespace(text="Fill in your name and age.")
+
+    monkeypatch.setattr(rag, "_generate_with_prefix", fake_generate)
+
+    help_text = rag.generate_comprehensive_form_help(
+        extracted_text="Name: _____ Age: _____ Address: _____",
+        detected_fields=[{"field": "Name", "type": "name"}, {"field": "Age", "type": "number"}],
+        document_type="application_form",
+        language="English"
+    )
+
+    assert help_text == "Fill in your name and age."
+    [(name, language, prompt)] = calls
+    assert (name, language) == ("comprehensive_form_help", "English")
+    assert "Document Type: application_form" in prompt
+    assert "Name: _____ Age: _____ Address: _____" in prompt
+    assert "- Name: name field" in prompt
+    assert "- Age: number field" in prompt
+    assert "in simple English" in prompt
+
+
+def test_rag_comprehensive_form_help_falls_back_offline(rag, monkeypatch):
+    def failing_generate(name, language, prompt, **kwargs):
+        raise RuntimeError("Gemini unavailable")
+
+    monkeypatch.setattr(rag, "_generate_with_prefix", failing_generate)
+
+    help_text = rag.generate_comprehensive_form_help(
+        extracted_text="Name: _____",
+        detected_fields=[{"field": "Name", "type": "name"}],
+        document_type="application_form",
+    )
+
+    assert help_text.startswith("Form Type: Application Form")
+
+
+def test_translation_service_initializes(translation):
+    assert translation.lang_codes["Hindi"] == "hi"
+
+
+def test_tts_service_initializes(tts):
+    assert tts.lang_codes["English"] == "en"
@@ -0,0 +1,45 @@
+"""
+RAGService helpers that run without calling Gemini
+"""
+
+
+def test_detect_image_mime_from_header(rag):
+    assert rag._detect_image_mime("data:image/png;base64", b"") == "image/png"
+    assert rag._detect_image_mime("data:image/jpeg;base64", b"") == "image/jpeg"
+    assert rag._detect_image_mime("data:image/webp;base64", b"") == "image/webp"
+
+
+def test_detect_image_mime_from_magic_bytes(rag):
+    assert rag._detect_image_mime(None, b"\x89PNG\r\n\x1a\n....") == "image/png"
+    assert rag._detect_image_mime(None, b"\xff\xd8\xff\xe0....") == "image/jpeg"
+    assert rag._detect_image_mime(None, b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+
+
+def test_detect_image_mime_unknown(rag):
+    assert rag._detect_image_mime(None, b"GIF89a....") is None
+    assert rag._detect_image_mime(None, b"RIFF\x00\x00\x00\x00WAVEfmt ") is None
+
+
+def test_detect_image_mime_unsupported_header_sniffs_bytes(rag):
+    assert rag._detect_image_mime("data:image/gif;base64", b"\x89PNG\r\n\x1a\n") == "image/png"
+    assert rag._detect_image_mime("data:image/gif;base64", b"GIF89a") is None
+
+
+def test_simple_form_help_output(rag):
+    fields = [{"field": "Name", "type": "name"}, {"field": "Age", "type": "number"}]
+    assert rag._generate_simple_form_help(fields, "application_form") == (
+        "Form Type: Application Form\n"
+        "\nRequired Information:\n"
+        "- Full Name: Write your complete name as per official documents\n"
+        "- Age: Fill accurately\n"
+        "\nGeneral Tips:\n"
+        "- Use black/blue pen only\n"
+        "- Write clearly in capital letters\n"
+        "- Do not leave mandatory fields blank\n"
+        "- Attach required documents"
+    )
+
+
+def test_simple_form_help_without_fields(rag):
+    help_text = rag._generate_simple_form_help([], "unknown")
+    assert help_text.startswith("Form Type: Unknown\n\nRequired Information:\n\nGeneral Tips:")
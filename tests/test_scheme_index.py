@@ -0,0 +1,30 @@
+"""
+LocalSchemeIndex keyword ranking (embeddings disabled)
+"""
+import pytest
+
+from app.services.scheme_index import LocalSchemeIndex
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = LocalSchemeIndex()
+    monkeypatch.setattr(index, "_get_vectors", lambda: None)
+    return index
+
+
+def test_keyword_ranking_puts_best_match_first(index):
+    assert index.search("crop insurance for farmers")[0]["name"] == "Pradhan Mantri Fasal Bima Yojana (PMFBY)"
+    assert index.search("pension for widow")[0]["name"] == "National Social Assistance Programme (NSAP)"
+
+
+def test_stopwords_alone_match_nothing(index):
+    assert index.search("scheme for the") == []
+
+
+def test_unknown_query_returns_nothing(index):
+    assert index.search("xyz") == []
+
+
+def test_top_k_limits_results(index):
+    assert len(index.search("farmers bank account aadhaar", top_k=2)) == 2
@@ -0,0 +1,77 @@
+"""
+SemanticCache exact-match and on-disk behaviour (embeddings disabled)
+"""
+import os
+import time
+
+import pytest
+
+from app.services import semantic_cache
+from app.services.semantic_cache import SemanticCache
+
+
+@pytest.fixture(autouse=True)
+def no_embeddings(monkeypatch):
+    monkeypatch.setattr(semantic_cache, "HAS_EMBEDDINGS", False)
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    cache = SemanticCache()
+    cache.set("PM Kisan  eligibility", "English", "answer")
+    assert cache.get("pm kisan eligibility", "English") == "answer"
+    assert cache.get("pm kisan benefits", "English") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = SemanticCache(ttl_seconds=10)
+    now = time.time()
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now)
+    cache.set("pm kisan", "English", "answer")
+    assert cache.get("pm kisan", "English") == "answer"
+
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now + 11)
+    assert cache.get("pm kisan", "English") is None
+
+
+def test_languages_are_isolated():
+    cache = SemanticCache()
+    cache.set("pm kisan", "English", "english answer")
+    cache.set("pm kisan", "Hindi", "hindi answer")
+    assert cache.get("pm kisan", "English") == "english answer"
+    assert cache.get("pm kisan", "Hindi") == "hindi answer"
+    assert cache.get("pm kisan", "Bengali") is None
+
+
+def test_disk_round_trip_across_instances(tmp_path):
+    SemanticCache(cache_dir=str(tmp_path)).set("pm kisan", "English", "answer")
+
+    fresh = SemanticCache(cache_dir=str(tmp_path))
+    assert fresh.get("pm kisan", "English") == "answer"
+    assert fresh.get("pm kisan", "Hindi") is None
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_expired_disk_entry_is_removed(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now)
+    SemanticCache(ttl_seconds=10, cache_dir=str(tmp_path)).set("pm kisan", "English", "answer")
+
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now + 11)
+    assert SemanticCache(ttl_seconds=10, cache_dir=str(tmp_path)).get("pm kisan", "English") is None
+    assert not os.listdir(tmp_path)
+
+
+def test_disk_prune_keeps_newest_entries(tmp_path):
+    cache = SemanticCache(max_entries=3, cache_dir=str(tmp_path))
+    for i in range(5):
+        cache.set(f"query {i}", "English", f"answer {i}")
+        # Distinct, increasing mtimes so the prune order is deterministic
+        path = cache._disk_path(cache._key(f"query {i}", "English"))
+        os.utime(path, (time.time() - 50 + i, time.time() - 50 + i))
+
+    cache._prune_disk()
+
+    assert len(os.listdir(tmp_path)) == 3
+    fresh = SemanticCache(cache_dir=str(tmp_path))
+    assert fresh.get("query 0", "English") is None
+    assert fresh.get("query 4", "English") == "answer 4"